@@ -20,9 +20,118 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from collections import ChainMap
 from itertools import combinations
+import functools
+import keyword
 import math
+import operator
+import types
+
+
+# math.pi as a module global (one lookup instead of two)
+_PI = math.pi
+
+
+# The numeric cores of the solver. These deal only in values, not in
+# side/angle names, and the Triangle methods map names to/from them.
+#
+# Naming convention, same as the default Triangle names:
+#    a, b, c are sides and alpha, beta, gamma respectively their
+#    opposing angles.
+#
+# Those that take an 'm' argument get their math functions from it. It is
+# the math module by default; Triangle.batch supplies numpy equivalents
+# so that the same code works on whole arrays at a time.
+
+def _sss_angles(a, b, c, area, m=math):
+    """Return (alpha, beta, gamma) given sides (a, b, c) and their area."""
+    # From the Law of Cosines and the area:
+    #
+    #     cos(alpha) = (b*b + c*c - a*a) / (2*b*c)
+    #     sin(alpha) = 2*area / (b*c)
+    #
+    # so alpha = atan2(4*area, b*b + c*c - a*a), likewise for the others.
+    # The acos() form is inaccurate for small angles (where its argument
+    # is near 1) and rounding can even push its argument out of [-1, 1].
+    # atan2 has neither problem, given an accurate area (see _area).
+    aa, bb, cc, k4 = (a * a), (b * b), (c * c), 4 * area
+    return (m.atan2(k4, bb + cc - aa),
+            m.atan2(k4, aa + cc - bb),
+            m.atan2(k4, aa + bb - cc))
+
+
+def _sas_side(a, c, beta, m=math):
+    """Return side b given sides a, c and their included angle beta."""
+    return m.sqrt((a * a) + (c * c) - (2 * a * c * m.cos(beta)))
+
+
+def _area(a, b, c, m=math):
+    """Return area of triangle with sides a >= b >= c (MUST be in order)."""
+    # This is Kahan's rearrangement of Heron's formula. It requires the
+    # sides to be sorted, and the parentheses matter. The textbook form,
+    # sqrt(s * (s-a) * (s-b) * (s-c)), loses most of its precision on
+    # needle-like triangles (in the s-a term).
+    p = (a + (b + c)) * (c - (a - b)) * (c + (a - b)) * (a + (b - c))
+
+    # Sides that only just fail the triangle inequality make the product
+    # slightly negative, and sides computed by the solver (e.g., SAS) can
+    # do that for nearly degenerate triangles. Those have (essentially)
+    # zero area. (p + abs(p)) / 2 is max(p, 0), but also works on arrays.
+    return 0.25 * m.sqrt((p + abs(p)) / 2)
+
+
+def _ssa_sides(a, b, alpha, m=math):
+    """Return (disc, c1, c2): the candidates for side c, given a, b, alpha.
+
+    If disc < 0 there are none (and c1, c2 are meaningless); deciding that
+    is up to the caller. Otherwise c1 >= c2; c1 is a solution if a > b or
+    alpha is acute, and c2 is a second solution if a < b and it is > 0
+    (see below).
+    """
+    # Law of Cosines, a*a = b*b + c*c - 2*b*c*cos(alpha), is a
+    # quadratic in the unknown side c, with roots:
+    #
+    #       c = b*cos(alpha) +/- sqrt(a*a - (b*sin(alpha))**2)
+    #
+    # If there are no (real) roots there is no solution. The '+'
+    # root is the solution if a > b or alpha is acute (otherwise it
+    # is <= 0; there is no room left for gamma). The '-' root is the
+    # second solution in the ambiguous case, which is when a < b (if
+    # a >= b it is <= 0). In both cases, test those conditions rather
+    # than the sign of the root, because when a == b rounding can make
+    # a zero root a tiny positive number. This is the same result the
+    # Law of Sines would give, without its asin/sin computations.
+    b_cos = b * m.cos(alpha)
+    b_sin = b * m.sin(alpha)
+    disc = (a - b_sin) * (a + b_sin)
+
+    # (disc + abs(disc)) / 2 is max(disc, 0), as in _area, so that a
+    # negative disc doesn't raise (or warn, for arrays) here.
+    root = m.sqrt((disc + abs(disc)) / 2)
+    return disc, b_cos + root, b_cos - root
+
+
+# Sorting exactly three values with a compare/swap network is several
+# times faster than sorted(), which is all overhead for so few values.
+def _sorted3(values):
+    x, y, z = values
+    if x > y:
+        x, y = y, x
+    if y > z:
+        y, z = z, y
+    if x > y:
+        x, y = y, x
+    return x, y, z
+
+
+def _sorted_squares3(values):
+    x, y, z = _sorted3(values)
+    return x * x, y * y, z * z
+
+
+def _area3(values):
+    c, b, a = _sorted3(values)
+    return _area(a, b, c)
 
 
 class Triangle:
@@ -56,6 +165,17 @@ class Triangle:
     #
     #    angle_names[i] is the angle opposing side_names[i]
 
+    # Instances have a fixed set of attributes, so use __slots__ to save
+    # the memory (and lookup) cost of a per-instance __dict__.
+    #
+    # NOTE: A subclass that overrides the names and does NOT define
+    #       __slots__ will get a __dict__ (which is fine). A subclass that
+    #       does define __slots__ must include its side and angle names.
+    #       The fromnames() factory does this automatically (unless the
+    #       names are not valid identifiers, which slots must be).
+    __slots__ = side_names + angle_names + (
+        '__origparams', '__memo', '__weakref__')
+
     # function called to determine when floats are "close" (can be overridden)
     isclose = math.isclose
 
@@ -147,24 +267,49 @@ class Triangle:
             kwargs = args[0]      # it should be a dict, will find out below!
 
         # The __repr__ is the original parameters, in a canonical order.
-        self.__origparams = [
-            n for n in self.side_names + self.angle_names if n in kwargs]
+        self.__origparams = [n for n in self._all_names if n in kwargs]
+        self.__memo = None          # see __derived
 
         # Use the solver, turn all into SSS (possibly two solutions), filter
-        # NOTE: There is a (subtle) recursion here if a triangle_filter
-        #       was specified -- construct a trial triangle from SSS
-        #       (and no filter) and pass it to the given filter to test it.
+        # NOTE: If a triangle_filter was specified, a trial triangle is
+        #       made from each SSS solution and passed to the filter. The
+        #       solutions are already valid so _from_params skips the solver.
         solns = [s for s in self.sss_solutions(**kwargs)
                  if s is not None and (triangle_filter is None or
-                                       triangle_filter(self.__class__(**s)))]
+                                       triangle_filter(self._from_params(s)))]
 
         if len(solns) != 1:
             raise ValueError(f"{kwargs} has {len(solns)} solutions")
 
-        # set all the attrs, use kwargs in favor of computed sides or angles
-        for k, v in ChainMap(kwargs, self.compute_angles(*solns)).items():
+        # Set the sides, using kwargs in favor of computed sides, and any
+        # angles that were given. The other angles are computed only if
+        # and when they are accessed (see __getattr__).
+        attrs = dict(*solns)
+        attrs.update(kwargs)
+        for k, v in attrs.items():
             setattr(self, k, v)
 
+    # Angles that were not given are computed on demand. __getattr__ is
+    # only invoked when normal attribute lookup fails, which is exactly
+    # the case of a (not yet computed) angle. All the missing angles are
+    # computed at once, after which they are ordinary attributes and this
+    # is not invoked again for them.
+    def __getattr__(self, name):
+        if name not in self._angle_set:
+            raise AttributeError(
+                f"{self.__class__.__name__!r} has no attribute {name!r}")
+
+        # NOTE: anything that might invoke __getattr__ recursively (e.g.,
+        #       hasattr) can't be used here to find the missing angles.
+        sides = self._get_sides(self)
+        angles = _sss_angles(*sides, _area3(sides))
+        for k, v in zip(self.angle_names, angles):
+            try:
+                object.__getattribute__(self, k)
+            except AttributeError:
+                setattr(self, k, v)
+        return object.__getattribute__(self, name)
+
     #
     # Checks legality of kwargs
     # Raises ValueError for various sanity check errors (sides < 0, etc)
@@ -174,12 +319,27 @@ class Triangle:
         for k, v in kwargs.items():
             if v <= 0:
                 raise ValueError(f"{k!r} (={v}) must be > 0")
-            if k in cls.angle_names:
-                if v >= math.pi:
+            if k in cls._angle_set:
+                if v >= _PI:
                     raise ValueError(f"angle {k!r} (={v}) >= π")
-            elif k not in cls.side_names:
+            elif k not in cls._side_set:
                 raise TypeError(f"{cls} got unexpected keyword arg {k!r}")
 
+    @classmethod
+    def _from_params(cls, params):
+        """Create a Triangle from known-valid params, bypassing solver."""
+        # A subclass that has its own __init__ may set up other state
+        # there, so in that case the triangle is made through the class.
+        if cls.__init__ is not Triangle.__init__:
+            return cls(**params)
+
+        t = object.__new__(cls)
+        for k, v in params.items():     # angles are computed on demand
+            setattr(t, k, v)
+        t.__origparams = [n for n in cls._all_names if n in params]
+        t.__memo = None
+        return t
+
     @classmethod
     def sss(cls, *args):
         """Factory/convenience: create a Triangle from sides w/out names."""
@@ -203,13 +363,20 @@ class Triangle:
           t = Triangle(**sss_1)
         """
 
+        # Fast path for the most common case, SSS with valid (> 0) sides,
+        # skipping the general argument checks and classification. Any
+        # other SSS (e.g., a side <= 0) goes the long way, which also
+        # produces the appropriate error.
+        if kwargs.keys() == cls._side_set and min(kwargs.values()) > 0:
+            return cls.__sss(kwargs)
+
         cls.__check_kwargs(kwargs)
-        sv = [k for k in cls.side_names if k in kwargs]
-        av = [k for k in cls.angle_names if k in kwargs]
 
-        # all valid forms have exactly three elements in aggregate
+        # all valid forms have exactly three elements in aggregate, and
+        # the given side and angle names for each are in the _forms table
         if len(kwargs) != 3:
             raise ValueError(f"{kwargs} over/under specified")
+        sv, av = cls._forms[frozenset(kwargs)]
 
         # 0, 1, 2, or 3 sides given:
         if len(sv) == 1:
@@ -217,27 +384,27 @@ class Triangle:
         elif len(sv) == 2:
             return cls.__sas_ssa(sv, av, kwargs)
         elif len(sv) == 3:
-            # SSS case; solution is as given but verify triangle rules
-            a, b, c = kwargs.values()
-            if a + b <= c or a + c <= b or b + c <= a:
-                raise ValueError(f"{kwargs} fails triangle inequality tests")
-            return kwargs, None
+            return cls.__sss(kwargs)
 
         # reaching here implies 0 sides given
         raise ValueError(f"{kwargs} must specify at least one side")
 
+    @classmethod
+    def __sss(cls, pm):
+        """Return SSS dict (and None) after verifying triangle inequality."""
+        # SSS case; solution is as given but verify triangle rules
+        a, b, c = pm.values()
+        if a + b <= c or a + c <= b or b + c <= a:
+            raise ValueError(f"{pm} fails triangle inequality tests")
+        return pm, None
+
     @classmethod
     def compute_angles(cls, sss):
         """Return a complete (angles and sides) triangle dict, given SSS."""
+        # angle_names[i] opposes side_names[i], so no name searching needed
         ax = sss.copy()
-        for angle_name in cls.angle_names:
-            oppsidename = cls.opposing_name(angle_name)
-            bname, cname = cls.other_names(oppsidename)
-            a = sss[oppsidename]
-            b = sss[bname]
-            c = sss[cname]
-            angle = math.acos(((b*b) + (c*c) - (a*a)) / (2*b*c))
-            ax[angle_name] = angle
+        sides = [sss[s] for s in cls.side_names]
+        ax.update(zip(cls.angle_names, _sss_angles(*sides, _area3(sides))))
         return ax
 
     @classmethod
@@ -245,13 +412,11 @@ class Triangle:
         """Return SSS dict given ((x0, y0), (x1, y1), (x2, y2))"""
         if len(coordinates) != 3:
             raise ValueError(f"{coordinates} must be three (x,y) tuples")
-        sss = {}
-        for twopts, k in zip(combinations(coordinates, 2), cls.side_names):
-            v0, v1 = twopts
-            dx = v1[0]-v0[0]
-            dy = v1[1]-v0[1]
-            sss[k] = math.sqrt((dx * dx) + (dy * dy))
-        return sss
+        # sides, in side_names order, span vertices 0-1, 0-2, and 1-2
+        (x0, y0), (x1, y1), (x2, y2) = coordinates
+        return dict(zip(cls.side_names, (math.hypot(x1 - x0, y1 - y0),
+                                         math.hypot(x2 - x0, y2 - y0),
+                                         math.hypot(x2 - x1, y2 - y1))))
 
     @classmethod
     def __sas_ssa(cls, sv, av, pm):
@@ -282,49 +447,34 @@ class Triangle:
             ob_name = cls.opposing_name(b_name)
             b = pm[b_name]
 
-            # Law of Sines a/sin(alpha) = b/sin(beta) = c/sin(gamma)
-            alpha_sin = math.sin(alpha)
-            try:
-                beta = math.asin((alpha_sin * b) / a)
-            except ValueError:
+            # Law of Cosines (see _ssa_sides for details)
+            disc, c1, c2 = _ssa_sides(a, b, alpha)
+            if disc < 0:
                 raise ValueError(f"no angle solution for {ob_name}")
 
-            # third angle is whatever is left
-            gamma = math.pi - (alpha + beta)
-            if gamma <= 0:
+            # c1 is a solution if a > b, or if alpha is acute. Otherwise
+            # it is <= 0, although rounding can make it a tiny positive
+            # value (e.g., a == b where it is exactly 2*b*cos(alpha)), so
+            # test that directly.
+            # NOTE: Testing c1 against the triangle inequality instead
+            #       would be wrong the other way: a valid needle-like
+            #       triangle (e.g., alpha and b tiny, so c1 is nearly
+            #       a + b) can round to sides that fail it.
+            if (a <= b and alpha >= _PI / 2) or c1 <= 0:
                 raise ValueError(f"no angle solution for {oc_name}")
+            d1 = {a_name: a, b_name: b, c_name: c1}
 
-            # third side from law of Sines
-            c = (math.sin(gamma) * a) / alpha_sin
-
-            d1 = {a_name: a, b_name: b, c_name: c}
-
-            # check for ambiguous case regarding beta:
-            #   pi - beta would have the same sin and MIGHT be a solution.
-            #   Can rule that out if
-            #       alpha + (pi - beta) >= pi
-            #   as there would be nothing left for gamma
-            #
-            # Said another way, another triangle is possible if
-            #       alpha + (pi - beta) < pi
-            # Simplifying by subtracting pi from both sides:
-            #       alpha - beta < 0 is the ambiguous case
-            # or    beta > alpha
-            if beta > alpha:
-                # compute the alternate solution
-                beta = math.pi - beta
-                gamma = math.pi - (alpha + beta)
-                c = (math.sin(gamma) * a) / alpha_sin
-                d2 = {a_name: a, b_name: b, c_name: c}
+            # the second root is a second solution only if a < b, and
+            # then only if it is a different, positive, value (a zero
+            # root is a single right-angled solution)
+            if a < b and c2 > 0 and c2 != c1:
+                d2 = {a_name: a, b_name: b, c_name: c2}
             else:
                 d2 = None
         else:
             # SAS - much simpler; use law of cosines
-            a = pm[sv[0]]
-            c = pm[sv[1]]
-            beta = pm[av[0]]
-            b = math.sqrt((a*a) + (c*c) - (2 * a * c * math.cos(beta)))
-            pm[cls.opposing_name(av[0])] = b
+            pm[cls.opposing_name(av[0])] = _sas_side(
+                pm[sv[0]], pm[sv[1]], pm[av[0]])
             d1 = {s: pm[s] for s in cls.side_names}
             d2 = None
 
@@ -338,57 +488,74 @@ class Triangle:
         consistent with __sas_ssa and sss_solutions expectations.
         """
 
-        # gamma name is whichever angle name that wasn't given
-        # gamma, the third angle, is whatever is left after the other two
-        gamma = math.pi
-        for a in cls.angle_names:
-            if a in pm:
-                gamma -= pm[a]
-            else:
-                gamma_name = a
+        # gamma is whichever angle wasn't given, and is whatever is
+        # left after the other two
+        gamma_name = cls.other_names(*av)[0]
+        gamma = _PI - pm[av[0]] - pm[av[1]]
         if gamma <= 0:
             raise ValueError(f"{pm}: no solution for third angle")
-
         pm[gamma_name] = gamma
 
-        # now that all three angles are known... law of Sines
-        s0 = pm[sv[0]]
-        ratio = s0 / math.sin(pm[cls.opposing_name(sv[0])])
-        for s in cls.side_names:
-            if s != sv[0]:
-                sx = math.sin(pm[cls.opposing_name(s)]) * ratio
-                pm[s] = sx
+        # now that all three angles are known... law of Sines, with
+        # the (given side)/sin(its opposing angle) ratio computed once
+        s0 = sv[0]
+        ratio = pm[s0] / math.sin(pm[cls._opposing[s0]])
+        for s in cls._others_of[frozenset((s0,))]:
+            pm[s] = math.sin(pm[cls._opposing[s]]) * ratio
         return {s: pm[s] for s in cls.side_names}, None
 
     @classmethod
     def opposing_name(cls, name):
         """Return opposing angle name for given side name, or vice versa."""
-        if name in cls.side_names:
-            return cls.angle_names[cls.side_names.index(name)]
-        elif name in cls.angle_names:
-            return cls.side_names[cls.angle_names.index(name)]
-        else:
-            return None
+        return cls._opposing.get(name)
 
     @classmethod
     def other_names(cls, _name, *more):
         """Given 1 or more side names or angle names, return the others."""
 
         # The explicit "_name" in def forces python to enforce "at least
-        # one argument required" ... then this puts all the args back
-        # into one tuple for convenience
-        names = (_name, *more)
-
-        if names[0] in cls.side_names:
-            candidates = cls.side_names
-        else:
-            candidates = cls.angle_names
-
-        for n in names:
-            if n not in candidates:
+        # one argument required". Every valid combination of names is in
+        # the _others_of table, so normally this is just one lookup.
+        try:
+            return list(cls._others_of[frozenset((_name, *more))])
+        except KeyError:
+            pass
+
+        # The first name determines whether these are side names or angle
+        # names; report the first name that is unknown or of the other kind
+        names = cls._side_set if _name in cls._side_set else cls._angle_set
+        for n in (_name, *more):
+            if n not in names:
                 raise ValueError(f"mismatching or unknown name '{n}'")
 
-        return [x for x in candidates if x not in names]
+    # The name relationships used by opposing_name/other_names are fixed
+    # once side_names and angle_names are defined, so they are computed
+    # once per class (here and in __init_subclass__) into lookup tables
+    # rather than searched for in the name tuples on every call.
+    @classmethod
+    def _build_name_tables(cls):
+        cls._opposing = {**dict(zip(cls.side_names, cls.angle_names)),
+                         **dict(zip(cls.angle_names, cls.side_names))}
+        cls._others_of = {frozenset(c): tuple(x for x in names if x not in c)
+                          for names in (cls.side_names, cls.angle_names)
+                          for k in (1, 2, 3)
+                          for c in combinations(names, k)}
+        cls._all_names = cls.side_names + cls.angle_names
+        cls._side_set = frozenset(cls.side_names)
+        cls._angle_set = frozenset(cls.angle_names)
+        cls._get_sides = operator.attrgetter(*cls.side_names)
+        cls._get_angles = operator.attrgetter(*cls.angle_names)
+
+        # (side names, angle names), each in canonical order, for every
+        # possible set of three parameter names
+        cls._forms = {
+            frozenset(c): (tuple(n for n in c if n in cls._side_set),
+                           tuple(n for n in c if n in cls._angle_set))
+            for c in combinations(cls._all_names, 3)}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._build_name_tables()
 
     def opposing(self, name):
         """Return opposing angle/side VALUE for given side/angle NAME."""
@@ -399,77 +566,131 @@ class Triangle:
 
     def threesides(self):
         """a, b, c = t.threesides()"""
-        return [getattr(self, s) for s in self.side_names]
+        return list(self._get_sides(self))
 
     def threeangles(self):
         """alpha, beta, gamma = t.threeangles()"""
-        return [getattr(self, a) for a in self.angle_names]
+        return list(self._get_angles(self))
+
+    # Values derived from the sides (area, classification) are memoized,
+    # because area() and predicates such as acute/obtuse are often called
+    # repeatedly (e.g., altitude() or a triangle_filter). The attributes
+    # are ordinary attributes that can be assigned at any time, so each
+    # memoized value is kept along with the values it was derived from
+    # and is only reused if those still match. (Sorting three values is
+    # cheaper than a memo lookup, so sorted sides/angles are not memoized.)
+    #
+    # NOTE: The memo dict is only created when first needed; until then
+    #       it is None. It must not be left unset, because a failed lookup
+    #       of it would go through __getattr__, which is slow.
+    def __derived(self, key, getter, f):
+        """Return f(getter(self)), memoized under the given key."""
+        values = getter(self)
+        memo = self.__memo
+        if memo is None:
+            memo = self.__memo = {}
+        else:
+            entry = memo.get(key)
+            if entry is not None and entry[0] == values:
+                return entry[1]
+        v = f(values)
+        memo[key] = (values, v)
+        return v
 
     def canonicaltriangle(self):
         """Return a new triangle with sides in size order low-to-high."""
-        sides = self.threesides()
-        return Triangle(**dict(zip(self.side_names, sorted(sides))))
+        # these are (presumably) valid sides already; no need to re-solve
+        # (but see _from_params regarding subclasses with an __init__)
+        return self._from_params(dict(zip(self.side_names,
+                                          _sorted3(self._get_sides(self)))))
 
     def copy(self):
         """Return new copy of a Triangle."""
-        t = self.__class__(**{k: getattr(self, k) for k in self.__origparams})
-        # because there's no guarantee attrs haven't bashed inconsistently...
-        for k in self.side_names + self.angle_names:
-            setattr(t, k, getattr(self, k))
+        # The attributes are copied as they are, rather than re-solving
+        # from the original parameters, because there's no guarantee
+        # attrs haven't been bashed inconsistently anyway. Angles not yet
+        # computed (see __getattr__) are left that way in the copy.
+        t = self._from_params(
+            {k: getattr(self, k) for k in self.__origparams})
+        for k in self._all_names:
+            try:
+                v = object.__getattribute__(self, k)
+            except AttributeError:
+                continue
+            setattr(t, k, v)
+        t.__origparams = self.__origparams.copy()
+        t.__memo = None
         return t
 
     def equilateral(self):
         """Return TRUE if triangle is equilateral (uses isclose)."""
-        a, b, c = self.threesides()
+        a, b, c = self._get_sides(self)
         return self.isclose(a, b) and self.isclose(b, c) and self.isclose(a, c)
 
     def isosceles(self):
         """Return TRUE if triangle is isosceles (uses isclose)."""
-        a, b, c = self.threesides()
+        a, b, c = self._get_sides(self)
 
         # NOTE: "inclusive" definition in which equilateral is also isosceles
         return self.isclose(a, b) or self.isclose(a, c) or self.isclose(b, c)
 
+    def classification(self):
+        """Return 'acute', 'right', or 'obtuse' (uses isclose)."""
+        return self.__derived(
+            'classification', self._get_sides, self.__classify)
+
+    def __classify(self, sides):
+        # The largest angle is opposite the largest side, and it is right,
+        # acute, or obtuse according to whether the squares of the other
+        # two sides sum to, exceed, or fall short of the square of the
+        # largest. Comparing side squares this way requires no trig.
+        #
+        # To handle floating point (im)precision, if the triangle is
+        # "close enough" to being pythagorean (right triangle), it is
+        # neither acute nor obtuse. If it is not close enough, then there
+        # is no further concern about floating point fuzziness.
+        aa, bb, cc = _sorted_squares3(sides)
+        if self.isclose(aa + bb, cc):
+            return 'right'
+        return 'acute' if aa + bb > cc else 'obtuse'
+
     def pythagorean(self):
         """Return TRUE if triangle is a right triangle (uses isclose)."""
-        a, b, c = sorted(self.threesides())
-
-        return self.isclose((a * a) + (b * b), (c * c))
+        return self.classification() == 'right'
 
     def acute(self):
         """Return TRUE if not pythagorean and all three angles are < 90."""
-        # To handle floating point (im)precision, if the triangle is
-        # "close enough" to being pythagorean (right triangle), it is
-        # not acute. If it is not close enough, then there is no further
-        # concern about floating point fuzziness.
-        if self.pythagorean():
-            return False
-        return all(a < math.pi/2 for a in self.threeangles())
+        return self.classification() == 'acute'
 
     def not_acute(self):
         """Convenience for ssa_filter use; allows pythagorean or obtuse."""
-        return self.pythagorean() or self.obtuse()
+        return self.classification() != 'acute'
 
     def obtuse(self):
-        """Return TRUE if not pythagorean and all three angles are > 90."""
-        return not self.pythagorean() and not self.acute()
+        """Return TRUE if not pythagorean and one angle is > 90."""
+        return self.classification() == 'obtuse'
 
     def not_obtuse(self):
         """Convenience for ssa_filter use; allows pythagorean or acute."""
-        return self.pythagorean() or self.acute()
+        return self.classification() != 'obtuse'
 
     def area(self):
-        """Return triangle area. Always uses Heron's formula."""
+        """Return triangle area. Uses a numerically stable Heron's formula."""
 
-        a, b, c = self.threesides()
-        s = (a + b + c) / 2
+        return self.__derived('area', self._get_sides, _area3)
 
-        return math.sqrt(s * (s - a) * (s - b) * (s - c))
+    @classmethod
+    def area_from_coords(cls, coordinates):
+        """Return area of triangle given ((x0, y0), (x1, y1), (x2, y2))"""
+        if len(coordinates) != 3:
+            raise ValueError(f"{coordinates} must be three (x,y) tuples")
+        (x0, y0), (x1, y1), (x2, y2) = coordinates
+        return abs(((x1 - x0) * (y2 - y0)) - ((x2 - x0) * (y1 - y0))) / 2
 
     def altitude(self, basename):
         """Return the geometric 'altitude' (height) from the given base."""
 
-        if basename not in self.side_names:
+        if basename not in self._side_set:
             raise ValueError(f"{basename} is not a side name in {self}")
         return (2 * self.area()) / getattr(self, basename)
 
@@ -481,19 +702,152 @@ class Triangle:
         and performing rotation reflection.
         """
 
-        # sorting the angles is essentially rotation/reflection as needed
-        return all(map(self.isclose,
-                       sorted(self.threeangles()),
-                       sorted(t.threeangles())))
+        # sorting the angles is essentially rotation/reflection as needed.
+        # The angles sum to pi, so if the two smallest match then so does
+        # the third (largest) one; no need to compare it.
+        s0, s1, _ = _sorted3(self._get_angles(self))
+        t0, t1, _ = _sorted3(t._get_angles(t))
+        return self.isclose(s0, t0) and self.isclose(s1, t1)
 
     # obviously this is just a convenience function as all it does
-    # is multiply each side by the given factor.
+    # is multiply each side by the given factor. Angles don't change.
     def scale(self, factor):
         """Scale a triangle by the given factor."""
         if factor <= 0:
             raise ValueError(f"{self} illegal scale factor {factor}")
-        for n in self.side_names:
-            setattr(self, n, getattr(self, n) * factor)
+        oldsides = a, b, c = self._get_sides(self)
+        sides = (a * factor, b * factor, c * factor)
+        for n, v in zip(self.side_names, sides):
+            setattr(self, n, v)
+
+        # Rather than have it recomputed, bring the memoized area up to
+        # date directly. Other memoized values are left to be
+        # recomputed; e.g., 'classification' is NOT scale-invariant if
+        # isclose has been overridden with an absolute tolerance.
+        memo = self.__memo
+        if memo is None:
+            return
+        entry = memo.get('area')
+        if entry is not None and entry[0] == oldsides:
+            memo['area'] = (sides, entry[1] * factor * factor)
+
+    # Triangle.batch(**kwargs):
+    #
+    # Solve many triangles at once. Each keyword argument is an array (or
+    # anything numpy.asarray accepts; a scalar is broadcast against the
+    # others) and the same SSS/SSA/SAS/AAS/ASA forms as for Triangle()
+    # are accepted. All the triangles are solved in one pass over the
+    # arrays, instead of creating one Triangle object (and making one set
+    # of math calls) per triangle.
+    #
+    # The result is a dict mapping each of the side and angle names to a
+    # numpy array of values, e.g.:
+    #
+    #    r = Triangle.batch(a=[3, 5, 8], b=[4, 12, 15], c=[5, 13, 17])
+    #    r['gamma']  --> array([1.57079633, 1.57079633, 1.57079633])
+    #
+    # If the parameters are invalid for ANY of the triangles, an exception
+    # is raised just as Triangle() would for the same parameters. That
+    # includes ambiguous SSA parameters, unless ssa_solution is given to
+    # choose between the two solutions (in the same order as sss_solutions
+    # returns them; 1 is the one with the longer third side):
+    #
+    #    r = Triangle.batch(a=[3, 3], b=4, alpha=math.pi/6, ssa_solution=2)
+    #
+    # Triangles with only one solution get that solution either way, and
+    # ssa_solution has no effect on the other (non-SSA) forms.
+    #
+    # This requires numpy, which is otherwise not needed by this module.
+    #
+    @classmethod
+    def batch(cls, *, ssa_solution=None, **kwargs):
+        """Solve arrays of triangle parameters; see documentation."""
+        if ssa_solution not in (None, 1, 2):
+            raise ValueError(f"ssa_solution ({ssa_solution!r}) must be 1 or 2")
+        import numpy as np
+        m = types.SimpleNamespace(atan2=np.arctan2, cos=np.cos,
+                                  sin=np.sin, sqrt=np.sqrt)
+
+        pm = dict(zip(kwargs, np.broadcast_arrays(
+            *(np.asarray(v, dtype=float) for v in kwargs.values()))))
+
+        # same tests, in the same order, as __check_kwargs
+        for k, v in pm.items():
+            if np.any(v <= 0):
+                raise ValueError(f"{k!r} values must be > 0")
+            if k in cls._angle_set:
+                if np.any(v >= _PI):
+                    raise ValueError(f"angle {k!r} values must be < π")
+            elif k not in cls._side_set:
+                raise TypeError(f"{cls} got unexpected keyword arg {k!r}")
+
+        if len(pm) != 3:
+            raise ValueError(f"{list(pm)} over/under specified")
+
+        sv = [k for k in cls.side_names if k in pm]
+        av = [k for k in cls.angle_names if k in pm]
+
+        # these follow the corresponding scalar solvers; see them for details
+        if len(sv) == 3:
+            a, b, c = pm.values()
+            if np.any((a + b <= c) | (a + c <= b) | (b + c <= a)):
+                raise ValueError(f"{sv} fail triangle inequality tests")
+        elif len(sv) == 2:
+            oppside_name = cls.opposing_name(av[0])
+            if oppside_name in sv:
+                # SSA
+                c_name = cls.other_names(*sv)[0]
+                b_name = cls.other_names(oppside_name, c_name)[0]
+                a = pm[oppside_name]
+                b = pm[b_name]
+                alpha = pm[av[0]]
+                disc, c, c2 = _ssa_sides(a, b, alpha, m)
+                if np.any(disc < 0):
+                    raise ValueError(
+                        f"no angle solution for {cls.opposing_name(b_name)}")
+                if np.any(((a <= b) & (alpha >= _PI / 2)) | (c <= 0)):
+                    raise ValueError(
+                        f"no angle solution for {cls.opposing_name(c_name)}")
+                two = (a < b) & (c2 > 0) & (c2 != c)
+                if ssa_solution == 2:
+                    c = np.where(two, c2, c)
+                elif ssa_solution != 1 and np.any(two):
+                    raise ValueError(f"{list(pm)} has 2 solutions")
+                pm[c_name] = c
+            else:
+                # SAS
+                pm[oppside_name] = _sas_side(
+                    pm[sv[0]], pm[sv[1]], pm[av[0]], m)
+        elif len(sv) == 1:
+            # AAS/ASA
+            gamma_name = cls.other_names(*av)[0]
+            gamma = _PI - (pm[av[0]] + pm[av[1]])
+            if np.any(gamma <= 0):
+                raise ValueError(f"no solution for third angle {gamma_name}")
+            pm[gamma_name] = gamma
+            s0 = sv[0]
+            ratio = pm[s0] / np.sin(pm[cls.opposing_name(s0)])
+            for s in cls.other_names(s0):
+                pm[s] = np.sin(pm[cls.opposing_name(s)]) * ratio
+        else:
+            raise ValueError(f"{list(pm)} must specify at least one side")
+
+        # as with Triangle(), given angles are used in favor of computed
+        sides = [pm[s] for s in cls.side_names]
+        angles = _sss_angles(*sides, cls.batch_area(*sides), m)
+        for k, v in zip(cls.angle_names, angles):
+            pm.setdefault(k, v)
+        return {k: pm[k] for k in cls._all_names}
+
+    @staticmethod
+    def batch_area(a, b, c):
+        """Return array of areas given arrays of sides; requires numpy."""
+        import numpy as np
+
+        # sort each triangle's sides and use the same formula as area()
+        c, b, a = np.sort(np.stack(np.broadcast_arrays(
+            *(np.asarray(v, dtype=float) for v in (a, b, c)))), axis=0)
+        return _area(a, b, c, np)
 
     # Factory to make a Triangle subclass from a string specification.
     # Handy for simple geometry problems where the angles are given
@@ -550,8 +904,16 @@ class Triangle:
     #    ==> angle_names = ('A1', 'A2', 'A3')
     #        side_names = ('s1', 's2', 's3')
     #
+    # Repeated calls with the same arguments return the same class, rather
+    # than constructing another (identical) one each time.
+    #
     @classmethod
     def fromnames(cls, s, /, *s23, name=None):
+        return cls.__fromnames(s, s23, name)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def __fromnames(s, s23, name):
         specs = (s, *s23)
         if len(specs) == 1 and len(s) == 1:   # "triangle name" format
             specs = ('<' + s + '1', '<' + s + '2', '<' + s + '3')
@@ -594,13 +956,24 @@ class Triangle:
         if len(u) != 6:
             raise ValueError("Could not construct six unique names")
 
-        return type(name or f"fromnames.{s}",
-                    (Triangle,),
-                    dict(angle_names=angles, side_names=sides))
+        # __slots__ (see Triangle) only if all the names can be slots;
+        # otherwise the class just gets a __dict__
+        attrs = dict(angle_names=angles, side_names=sides)
+        if all(n.isidentifier() and not keyword.iskeyword(n) for n in u):
+            attrs['__slots__'] = sides + angles
+        return type(name or f"fromnames.{s}", (Triangle,), attrs)
+
+
+# __init_subclass__ takes care of subclasses; Triangle itself is done here
+Triangle._build_name_tables()
 
 
 if __name__ == '__main__':
     import unittest
+    try:
+        import numpy
+    except ImportError:
+        numpy = None
 
     class TriangleTestMethods(unittest.TestCase):
         @classmethod
@@ -661,6 +1034,20 @@ if __name__ == '__main__':
                  {'a': 1.1, 'b': 1.3, 'gamma': 1.03504236059}),
                 ({'a': 1.1, 'beta': 1.19862779, 'c': 1.2},
                  {'alpha': 0.907922503, 'b': 1.3, 'gamma': 1.03504236059}),
+
+                # isosceles SSA; only one solution (not a degenerate second)
+                ({'a': 3, 'b': 3, 'beta': math.pi/4},
+                 {'c': 3 * math.sqrt(2), 'gamma': math.pi/2}),
+                ({'b': 3, 'c': 3, 'gamma': math.pi/4},
+                 {'a': 3 * math.sqrt(2), 'alpha': math.pi/2}),
+                ({'a': 2, 'b': 2, 'alpha': math.pi/3},
+                 {'c': 2, 'gamma': math.pi/3}),
+
+                # needle-like SSA; c is so close to a + b that the
+                # computed sides fail the triangle inequality tests
+                ({'a': 3.0, 'b': 0.0003097045485501196,
+                  'alpha': 1.811710463936604e-11},
+                 {'c': 3.0 + 0.0003097045485501196}),
                 ]
 
             for v, rslts in tests:
@@ -669,6 +1056,17 @@ if __name__ == '__main__':
                     self.assertTrue(
                         self.fuzzy_equal(getattr(tx, a), rslts[a]))
 
+            # the trial triangles given to a triangle_filter are made
+            # through a subclass's own __init__ (if it has one)
+            class Tol(Triangle):
+                def __init__(self, *args, tol=2, **kwargs):
+                    self.tol = tol
+                    super().__init__(*args, **kwargs)
+
+            tx = Tol(a=3, b=4, alpha=0.6724600056836807,
+                     triangle_filter=lambda t: t.c > t.tol)
+            self.assertTrue(self.fuzzy_equal(tx.c, 4.8))
+
         def test_similar(self):
             self.assertTrue(self.t345.similar(Triangle(a=5, b=3, c=4)))
             self.assertTrue(self.t345.similar(self.t345))
@@ -705,6 +1103,8 @@ if __name__ == '__main__':
                 {'a': 4, 'b': 4.1, 'alpha': math.pi/2},  # no beta works
                                                          # angles too big
                 {'a': 4, 'beta': 0.75*math.pi, 'gamma': 0.75*math.pi},
+                {'a': 4, 'b': 4, 'alpha': math.pi/2},    # isosceles SSA
+                {'a': 4, 'b': 4, 'alpha': 2},            # with alpha >= 90
                 ]
             for v in vxxx:
                 self.assertRaises(ValueError, Triangle, **v)
@@ -720,6 +1120,102 @@ if __name__ == '__main__':
             self.assertTrue(self.t345.similar(Triangle(**d1)) or
                             self.t345.similar(Triangle(**d2)))
 
+        def test_area(self):
+            self.assertEqual(self.t345.area(), 6)
+            self.assertEqual(
+                Triangle.area_from_coords(((45, 42), (42, 42), (45, 46))), 6)
+
+            # a needle-like triangle (from Kahan's paper on this subject)
+            # where the textbook form of Heron's formula is only good to
+            # about 8 digits.
+            t = Triangle(a=100000.0, b=99999.99979, c=0.00029)
+            self.assertTrue(math.isclose(t.area(), 10.000000077021038,
+                                         rel_tol=1e-14))
+
+            # nearly degenerate solver results; these used to raise
+            # ValueError (math domain error) from a negative sqrt argument
+            t = Triangle(a=3.0, b=0.0003097045485501196,
+                         alpha=1.811710463936604e-11)
+            self.assertTrue(0 <= t.area() < 1e-4)
+            t = Triangle(a=116405334.09049714, c=4.23211116519474,
+                         beta=4.707985901480679e-09)
+            self.assertTrue(0 <= t.area() < 2)
+
+        @unittest.skipIf(numpy is None, "requires numpy")
+        def test_batch(self):
+            # the largest side is 'c' in all these (the SSA case needs it)
+            tv = [Triangle.sss(*sides) for sides in (
+                (3, 4, 5), (5, 12, 13), (2, 3, 4), (6, 6, 7), (1.1, 1.2, 1.3))]
+            forms = (('a', 'b', 'c'),                   # SSS
+                     ('a', 'b', 'gamma'),               # SAS
+                     ('b', 'c', 'gamma'),               # SSA
+                     ('alpha', 'beta', 'c'),            # ASA
+                     ('alpha', 'beta', 'a'))            # AAS
+            for form in forms:
+                with self.subTest(form=form):
+                    params = {k: [getattr(t, k) for t in tv] for k in form}
+                    r = Triangle.batch(**params)
+                    for i, t in enumerate(tv):
+                        tx = Triangle({k: params[k][i] for k in form})
+                        for k in t.side_names + t.angle_names:
+                            self.assertTrue(
+                                self.fuzzy_equal(r[k][i], getattr(tx, k)))
+
+            # scalars are broadcast
+            r = Triangle.batch(a=3, b=4, gamma=[math.pi/2, math.pi/3])
+            self.assertTrue(self.fuzzy_equal(r['c'][0], 5))
+            self.assertTrue(self.fuzzy_equal(r['c'][1], math.sqrt(13)))
+
+            areas = Triangle.batch_area(*(r[s] for s in Triangle.side_names))
+            self.assertEqual(areas[0], 6)
+
+            # sides in any order, and a needle triangle (see test_area)
+            areas = Triangle.batch_area([3, 100000.0], [4, 0.00029],
+                                        [5, 99999.99979])
+            self.assertEqual(areas[0], 6)
+            self.assertTrue(math.isclose(areas[1], 10.000000077021038,
+                                         rel_tol=1e-14))
+
+            # nearly degenerate sides (from SAS; see test_area); not NaN
+            areas = Triangle.batch_area(116405334.09049714,
+                                        116405329.85838597, 4.23211116519474)
+            self.assertEqual(areas, 0)
+
+            vxxx = [
+                {'a': [3, 3], 'b': [4, 4], 'c': [5, 555]},   # inequality
+                {'a': [3, 3], 'b': [4, 4], 'alpha': [0.1, 0.6435011]},
+                {'a': [3, 0], 'b': [4, 4], 'c': [5, 5]},     # <= 0
+                {'a': [3], 'b': [4]},                        # underspecified
+                ]
+            for v in vxxx:
+                with self.subTest(v=v):
+                    self.assertRaises(ValueError, Triangle.batch, **v)
+
+            # isosceles SSA has one solution (not a degenerate second one)
+            r = Triangle.batch(b=3, c=3, gamma=[math.pi/4, math.pi/3])
+            self.assertTrue(self.fuzzy_equal(r['a'][0], 3 * math.sqrt(2)))
+            self.assertTrue(self.fuzzy_equal(r['a'][1], 3))
+            self.assertRaises(ValueError, Triangle.batch,
+                              a=[3, 4], b=[4, 4], alpha=[0.5, math.pi/2])
+
+            # ambiguous SSA, choosing the solution
+            ssa = {'a': 3, 'b': 5, 'alpha': 0.6}
+            for n, sss in enumerate(Triangle.sss_solutions(**ssa), start=1):
+                with self.subTest(ssa_solution=n):
+                    r = Triangle.batch(ssa_solution=n, **ssa)
+                    self.assertTrue(self.fuzzy_equal(r['c'], sss['c']))
+
+            # a triangle with only one solution gets it either way
+            for n in (1, 2):
+                r = Triangle.batch(ssa_solution=n, a=6, b=5, alpha=0.7)
+                self.assertTrue(self.fuzzy_equal(
+                    r['c'], Triangle(a=6, b=5, alpha=0.7).c))
+
+            for n in (0, 3, '1'):
+                with self.subTest(ssa_solution=n):
+                    self.assertRaises(ValueError, Triangle.batch,
+                                      ssa_solution=n, **ssa)
+
         def test_altitude(self):
             # compute the altitudes relative to all three sides of
             # a precomputed result in various permutations. Overkill.
@@ -746,12 +1242,133 @@ if __name__ == '__main__':
                     x = sorted(list(expected))
                     self.assertEqual(r, x)
 
+        def test_lazy_angles(self):
+            # given angles are used as-is; others are computed when needed
+            t = Triangle(a=3, b=4, gamma=math.pi/2)
+            self.assertEqual(t.gamma, math.pi/2)
+            for a, v in self.abg345:
+                self.assertTrue(self.fuzzy_equal(getattr(t, a), v))
+
+            with self.assertRaises(AttributeError):
+                _ = t.rumplestiltskin
+
+            # also for subclasses, with or without __slots__
+            class PQRTriangle(Triangle):
+                side_names = ('p', 'q', 'r')
+                angle_names = ('huey', 'dewey', 'louie')
+
+            for T in (PQRTriangle, Triangle.fromnames('PQR')):
+                t = T(**dict(zip(T.side_names, (3, 4, 5))))
+                self.assertTrue(math.isclose(t.threeangles()[2], math.pi/2))
+                with self.assertRaises(AttributeError):
+                    _ = t.alpha
+
+        def test_thin_angles(self):
+            # a needle-like triangle; its small angle is essentially c
+            t = Triangle(a=1.0, b=1.0, c=1e-9)
+            self.assertTrue(math.isclose(t.gamma, 1e-9))
+            self.assertTrue(math.isclose(t.alpha + t.beta + t.gamma, math.pi))
+
+            # nearly degenerate (but valid) sides; gamma is nearly pi
+            # (this used to be able to raise ValueError from rounding)
+            a = b = 1.0
+            c = math.nextafter(a + b, 0)
+            t = Triangle(a=a, b=b, c=c)
+            self.assertTrue(math.isclose(t.alpha + t.beta + t.gamma, math.pi))
+            self.assertTrue(t.gamma > math.pi - 1e-6)
+
+            # the sides computed for this (SAS) are nearly degenerate, and
+            # computing the angles used to raise ValueError (domain error)
+            t = Triangle(a=8.38280831084736, b=6.207646499640279e-11,
+                         gamma=0.0001122701636556759)
+            self.assertTrue(hasattr(t, 'alpha'))
+            for angle in t.threeangles():
+                self.assertTrue(0 <= angle <= math.pi)
+
+        def test_memoized(self):
+            # derived values must track changes to the attributes
+            t = Triangle(a=3, b=4, c=5)
+            self.assertTrue(t.pythagorean())
+            self.assertFalse(t.acute())
+            self.assertEqual(t.area(), 6)
+            t.scale(2)
+            self.assertEqual(t.area(), 24)
+            self.assertEqual(t.altitude('a'), 8)
+            self.assertTrue(t.pythagorean())
+            self.assertTrue(t.similar(self.t345))
+            self.assertEqual(t.canonicaltriangle().threesides(), [6, 8, 10])
+            t.c = 9
+            self.assertFalse(t.pythagorean())
+            self.assertEqual(t.area(), Triangle(a=6, b=8, c=9).area())
+            t.alpha = 0.1
+            self.assertFalse(t.similar(self.t345))
+
+        def test_classification_scaled(self):
+            # with an absolute tolerance, classification depends on scale
+            class AbsTriangle(Triangle):
+                isclose = functools.partial(math.isclose, abs_tol=3)
+
+            t = AbsTriangle(a=3, b=4, c=5.2)
+            self.assertEqual(t.classification(), 'right')
+            t.scale(10)
+            self.assertEqual(t.classification(),
+                             AbsTriangle(a=30, b=40, c=52).classification())
+            self.assertEqual(t.classification(), 'obtuse')
+
+        def test_classification(self):
+            tv = (((3, 4, 5), 'right'),
+                  ((5, 3, 4), 'right'),
+                  ((4, 4, 4), 'acute'),
+                  ((4, 5, 6), 'acute'),
+                  ((3, 4, 6), 'obtuse'))
+            for sides, cl in tv:
+                with self.subTest(sides=sides):
+                    t = Triangle.sss(*sides)
+                    self.assertEqual(t.classification(), cl)
+                    self.assertEqual(t.pythagorean(), cl == 'right')
+                    self.assertEqual(t.acute(), cl == 'acute')
+                    self.assertEqual(t.obtuse(), cl == 'obtuse')
+                    self.assertEqual(t.not_acute(), cl != 'acute')
+                    self.assertEqual(t.not_obtuse(), cl != 'obtuse')
+
         def test_canon(self):
             t = Triangle(a=5, b=4, c=3)
             a, b, c = t.canonicaltriangle().threesides()
             self.assertTrue(a <= b)
             self.assertTrue(b <= c)
 
+            TX = Triangle.fromnames('X')
+            t = TX(X1=1.0, X2=0.5, sideX3=9)
+            tc = t.canonicaltriangle()
+            self.assertIs(type(tc), TX)
+            self.assertEqual(list(tc.threesides()), sorted(t.threesides()))
+            self.assertTrue(tc.similar(t))
+
+        def test_copy(self):
+            t = Triangle(a=3, b=4, gamma=math.pi/2)
+            t2 = t.copy()
+            self.assertEqual(repr(t), repr(t2))
+            self.assertEqual(t.threesides(), t2.threesides())
+            self.assertEqual(t.threeangles(), t2.threeangles())
+            t2.scale(2)
+            self.assertNotEqual(t.threesides(), t2.threesides())
+
+            # subclass __init__ is used for copies
+            class LabeledTriangle(Triangle):
+                def __init__(self, *args, label='x', **kwargs):
+                    super().__init__(*args, **kwargs)
+                    self.label = label
+
+            t = LabeledTriangle(a=3, b=4, c=5)
+            t.scale(2)
+            t2 = t.copy()
+            self.assertEqual(t2.label, 'x')
+            self.assertEqual(t2.threesides(), [6, 8, 10])
+            tc = LabeledTriangle(a=5, b=3, c=4).canonicaltriangle()
+            self.assertIsInstance(tc, LabeledTriangle)
+            self.assertEqual(tc.label, 'x')
+            self.assertEqual(tc.threesides(), [3, 4, 5])
+
         def test_opposingname(self):
             for a, s in zip(Triangle.angle_names, Triangle.side_names):
                 self.assertEqual(Triangle.opposing_name(a), s)
@@ -759,6 +1376,13 @@ if __name__ == '__main__':
 
             self.assertEqual(Triangle.opposing_name('rumplestiltskin'), None)
 
+            # subclasses get their own name tables
+            PQRTriangle = Triangle.fromnames('PQR')
+            self.assertEqual(PQRTriangle.opposing_name('Q'), 'PR')
+            self.assertEqual(PQRTriangle.opposing_name('PR'), 'Q')
+            self.assertEqual(PQRTriangle.opposing_name('alpha'), None)
+            self.assertEqual(PQRTriangle.other_names('P', 'R'), ['Q'])
+
         def test_coordinates(self):
             # various forms of a 3,4,5 triangle specified as coordinates
             tv = (((0, 0), (3, 0), (3, 4)),
@@ -798,6 +1422,7 @@ if __name__ == '__main__':
 
             pqr345 = PQRTriangle(p=3, q=4, r=5)
             pcopy = pqr345.copy()
+            self.assertTrue(hasattr(pqr345, '__dict__'))
             for t in (pqr345, pcopy):
                 self.assertTrue(self.t345.similar(t))
                 self.assertTrue(t.similar(self.t345))
@@ -809,6 +1434,8 @@ if __name__ == '__main__':
             pqr345 = PQRTriangle(PQ=3, QR=4, PR=5)
             self.assertTrue(pqr345.similar(self.t345))
             self.assertTrue(math.isclose(pqr345.Q, math.pi/2))
+            self.assertFalse(hasattr(pqr345, '__dict__'))
+            self.assertFalse(hasattr(self.t345, '__dict__'))
 
         def test_fromnames2(self):
             # a few tests of the other fromname formats
@@ -823,6 +1450,8 @@ if __name__ == '__main__':
             self.assertTrue(math.isclose(pqr345.AR, math.pi/2))
 
             TA = Triangle.fromnames('A')
+            self.assertIs(TA, Triangle.fromnames('A'))
+            self.assertIsNot(TA, Triangle.fromnames('A', name='TA'))
             self.assertEqual(TA.side_names[0], 'sideA1')
             self.assertEqual(TA.side_names[1], 'sideA2')
             self.assertEqual(TA.side_names[2], 'sideA3')
@@ -830,6 +1459,14 @@ if __name__ == '__main__':
             self.assertEqual(TA.angle_names[1], 'A2')
             self.assertEqual(TA.angle_names[2], 'A3')
 
+            # names that aren't identifiers (so can't be __slots__) work
+            for names in (('123',), ('1',), ('s-1', 's-2', 's-3')):
+                with self.subTest(names=names):
+                    T = Triangle.fromnames(*names)
+                    t = T(**dict(zip(T.side_names, (3, 4, 5))))
+                    self.assertTrue(t.similar(self.t345))
+                    self.assertTrue(hasattr(t, '__dict__'))
+
             # these are all illegal
             bads = (
                 ('XXX',),